@@ -1,14 +1,35 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
 import httpx
 from httpx_retries import Retry, RetryTransport
+from pydantic import TypeAdapter
+from pydantic_core import from_json
 
 import swcpy.swc_config as config
-from .schemas import League, Team, Player, Performance, Counts
-from typing import List
-import backoff
+from .schemas import League, Team, Player, PlayerBase, Performance, Counts, TeamBase
+from typing import Dict, Iterator, List, Optional
 import logging
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Built once per process: each adapter compiles its core schema up front and
+# decodes raw response bytes straight into models in a single Rust pass.
+_LEAGUES = TypeAdapter(List[League])
+_TEAMS = TypeAdapter(List[Team])
+_PLAYERS = TypeAdapter(List[Player])
+_PERFORMANCES = TypeAdapter(List[Performance])
+
+# Nested list field and its item model, for models built without validation.
+_NESTED_FIELDS = {
+    League: ('teams', TeamBase),
+    Team: ('players', PlayerBase),
+    Player: ('performances', Performance),
+}
+
 
 class SWCClient:
     """Interacts with the SportsWorldCentral API.
@@ -24,6 +45,24 @@ class SWCClient:
 
     """
 
+    __slots__ = (
+        "base_url",
+        "backoff",
+        "backoff_max_time",
+        "bulk_file_format",
+        "cache",
+        "trust_server",
+        "raise_for_status",
+        "transport",
+        "async_transport",
+        "_get_cache",
+        "_shared_keys",
+        "_closed",
+        "http_client",
+        "bulk_http_client",
+        "BULK_FILE_NAMES",
+    )
+
     HEALTH_CHECK_ENDPOINT = "/"
     LIST_LEAGUES_ENDPOINT = "/v0/leagues/"
     LIST_PLAYERS_ENDPOINT = "/v0/players/"
@@ -31,73 +70,279 @@ class SWCClient:
     LIST_TEAMS_ENDPOINT = "/v0/teams/"
     GET_COUNTS_ENDPOINT = "/v0/counts/"
 
+    # Bound str.format of the by-id URL templates, so a lookup is one call.
+    _league_by_id_url = (LIST_LEAGUES_ENDPOINT + "{}").format
+    _player_by_id_url = (LIST_PLAYERS_ENDPOINT + "{}").format
+
     BULK_FILE_BASE_URL = (
         'https://raw.githubusercontent.com/evrins/hands-on-api-data/main/bulk/'
     )
 
-    def __init__(self, cfg: config.SWCConfig):
-        logger.debug(f'Bulk file base URL: {self.BULK_FILE_BASE_URL}')
-        logger.debug(f'Swc client configuration: {cfg}')
+    BULK_FILE_STEMS = {
+        'players': 'player_data',
+        'leagues': 'league_data',
+        'performances': 'performance_data',
+        'teams': 'team_data',
+        'team_players': 'team_player_data',
+    }
+
+    BULK_FILE_CHUNK_SIZE = 1 << 20
+
+    # Read-only file name mappings shared by every client, keyed by extension.
+    _BULK_FILE_NAMES_CACHE = {}
+
+    # HTTP clients shared by every SWCClient built with the same settings, as
+    # [client, number of open SWCClients using it], so each pool is set up once.
+    _SHARED_HTTP_CLIENTS = {}
+    _SHARED_HTTP_CLIENTS_LOCK = threading.Lock()
+
+    # Seconds a cached response stays fresh, by how often the data changes.
+    COUNTS_CACHE_TTL = 60
+    GET_BY_ID_CACHE_TTL = 300
+    BULK_FILE_CACHE_TTL = 3600
+    CACHE_MAX_SIZE = 512
+
+    # Retry waits are BACKOFF_FACTOR * 2 ** attempt seconds, scaled by a random
+    # factor in [0, 1) (full jitter) so concurrent clients do not retry in lockstep.
+    BACKOFF_FACTOR = 0.5
+    BACKOFF_JITTER = 1.0
+
+    HTTP_LIMITS = httpx.Limits(
+        max_connections=32,
+        max_keepalive_connections=16,
+        keepalive_expiry=30.0,
+    )
+    HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+    MAX_CONCURRENT_REQUESTS = 16
+
+    def __init__(self, cfg: config.SWCConfig,
+                 transport: Optional[httpx.BaseTransport] = None,
+                 async_transport: Optional[httpx.AsyncBaseTransport] = None):
+        """Builds the HTTP clients for the API and the bulk files.
+
+        Args:
+        cfg:
+            The SWCConfig with the API URL, retry, cache and bulk file settings.
+        transport (optional):
+            A transport that answers the sync API and bulk file requests in
+            place of the network, such as httpx.MockTransport in tests.
+        async_transport (optional):
+            A transport that answers the concurrent requests of
+            get_players_by_ids and get_all_bulk_files. httpx.MockTransport
+            serves both roles, so the same instance may be passed twice.
+            transport is closed when the client is closed, async_transport
+            at the end of each batch call.
+
+        """
+        logger.debug('Bulk file base URL: %s', self.BULK_FILE_BASE_URL)
+        logger.debug('Swc client configuration: %s', cfg)
 
         self.base_url = cfg.swc_base_url
         self.backoff = cfg.swc_backoff
         self.backoff_max_time = cfg.swc_backoff_max_time
         self.bulk_file_format = cfg.swc_bulk_file_format
-
-        self.BULK_FILE_NAMES = {
-            'players': 'player_data',
-            'leagues': 'league_data',
-            'performances': 'performance_data',
-            'teams': 'team_data',
-            'team_players': 'team_player_data',
-        }
-
-        if self.backoff:
-            exp_retry = Retry(
-                max_backoff_wait=self.backoff_max_time,
-                retry_on_exceptions=[httpx.RequestError, httpx.HTTPStatusError],
+        self.cache = cfg.swc_cache
+        self.trust_server = cfg.swc_trust_server
+        self.raise_for_status = cfg.swc_raise_for_status
+        self.transport = transport
+        self.async_transport = async_transport
+        self._get_cache = OrderedDict()
+        self._closed = False
+
+        # An injected transport belongs to this client alone, so only clients
+        # talking to the network share their pools. The class is part of the
+        # key because subclasses may override the timeout, limits and backoff.
+        if transport is None:
+            cls = type(self)
+            self._shared_keys = (
+                (cls, self.base_url, self.backoff, self.backoff_max_time),
+                (cls, self.BULK_FILE_BASE_URL),
+            )
+            self.http_client = self._acquire(self._shared_keys[0], self._new_http_client)
+            self.bulk_http_client = self._acquire(
+                self._shared_keys[1], self._new_bulk_http_client
             )
-
-            transport = RetryTransport(retry=exp_retry)
-
-            self.http_client = httpx.Client(base_url=self.base_url, transport=transport)
         else:
-            self.http_client = httpx.Client(base_url=self.base_url)
-
-        # if self.backoff:
-        #     self.call_api = backoff.on_exception(
-        #         wait_gen=backoff.expo,
-        #         exception=(httpx.RequestError, httpx.HTTPStatusError),
-        #         max_time=self.backoff_max_time,
-        #         jitter=backoff.random_jitter,
-        #     )(self.__call_api)
+            self._shared_keys = ()
+            self.http_client = self._new_http_client()
+            self.bulk_http_client = self._new_bulk_http_client()
 
         if self.bulk_file_format.lower() == 'parquet':
             ext = '.parquet'
         else:
             ext = '.csv'
 
-        self.BULK_FILE_NAMES = {
-            k: v + ext for k, v in self.BULK_FILE_NAMES.items()
-        }
-
-        logger.debug(f'Bulk file dictionary: {self.BULK_FILE_NAMES}')
+        bulk_file_names = self._BULK_FILE_NAMES_CACHE.get(ext)
+        if bulk_file_names is None:
+            bulk_file_names = MappingProxyType(
+                {k: v + ext for k, v in self.BULK_FILE_STEMS.items()}
+            )
+            self._BULK_FILE_NAMES_CACHE[ext] = bulk_file_names
+        self.BULK_FILE_NAMES = bulk_file_names
+
+        logger.debug('Bulk file dictionary: %s', self.BULK_FILE_NAMES)
+
+    def _with_retries(self, transport):
+        """Wraps a sync or async transport in the retry policy when backoff is enabled."""
+        if not self.backoff:
+            return transport
+
+        exp_retry = Retry(
+            backoff_factor=self.BACKOFF_FACTOR,
+            backoff_jitter=self.BACKOFF_JITTER,
+            max_backoff_wait=self.backoff_max_time,
+            retry_on_exceptions=[httpx.RequestError, httpx.HTTPStatusError],
+        )
+        return RetryTransport(transport=transport, retry=exp_retry)
+
+    def _new_http_client(self) -> httpx.Client:
+        # Pool limits and HTTP/2 belong to the transport; httpx ignores the
+        # client-level options once a custom transport is supplied.
+        return httpx.Client(
+            base_url=self.base_url,
+            transport=self._with_retries(
+                self.transport or httpx.HTTPTransport(http2=True, limits=self.HTTP_LIMITS)
+            ),
+            timeout=self.HTTP_TIMEOUT,
+        )
+
+    def _new_bulk_http_client(self) -> httpx.Client:
+        return httpx.Client(
+            base_url=self.BULK_FILE_BASE_URL,
+            follow_redirects=True,
+            http2=True,
+            transport=self.transport,
+            timeout=30.0,
+        )
+
+    def _acquire(self, key, new_client) -> httpx.Client:
+        """Returns the shared HTTP client for key, building it on first use."""
+        with self._SHARED_HTTP_CLIENTS_LOCK:
+            entry = self._SHARED_HTTP_CLIENTS.get(key)
+            if entry is None:
+                entry = self._SHARED_HTTP_CLIENTS[key] = [new_client(), 0]
+            entry[1] += 1
+            return entry[0]
+
+    # The async clients live for one batch call: each call runs on its own
+    # event loop via asyncio.run, so calls from several threads never share a
+    # loop and nothing is left open once the call returns.
+    def _new_async_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            transport=self._with_retries(
+                self.async_transport
+                or httpx.AsyncHTTPTransport(http2=True, limits=self.HTTP_LIMITS)
+            ),
+            timeout=self.HTTP_TIMEOUT,
+        )
+
+    def _new_async_bulk_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.BULK_FILE_BASE_URL,
+            follow_redirects=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=8),
+            transport=self.async_transport,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying HTTP clients once no other SWCClient uses them.
+
+        Closing an already closed client does nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if not self._shared_keys:
+            self.http_client.close()
+            self.bulk_http_client.close()
+            return
+
+        with self._SHARED_HTTP_CLIENTS_LOCK:
+            for key in self._shared_keys:
+                entry = self._SHARED_HTTP_CLIENTS[key]
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._SHARED_HTTP_CLIENTS[key]
+                    entry[0].close()
+
+    def invalidate(self) -> None:
+        """Drops every cached response so the next calls hit the network."""
+        self._get_cache.clear()
+
+    def _cache_get(self, key: str):
+        if not self.cache:
+            return None
+
+        entry = self._get_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._get_cache[key]
+            return None
+        self._get_cache.move_to_end(key)
+        return value
+
+    def _cache_set(self, key: str, value, ttl: float) -> None:
+        if not self.cache:
+            return
+
+        self._get_cache[key] = (time.monotonic() + ttl, value)
+        self._get_cache.move_to_end(key)
+        if len(self._get_cache) > self.CACHE_MAX_SIZE:
+            # hits move entries to the end, so the first one is least recently used
+            self._get_cache.popitem(last=False)
+
+    def _cached_get(self, endpoint: str, ttl: float) -> bytes:
+        """Returns the response body for endpoint, caching the bytes of a 200."""
+        content = self._cache_get(endpoint)
+        if content is None:
+            response = self.call_api(endpoint)
+            content = response.content
+            if response.status_code == 200:
+                self._cache_set(endpoint, content, ttl)
+        return content
 
     def call_api(self, endpoint: str, params: dict = None) -> httpx.Response:
-        if params:
-            params = {k: v for k, v in params.items() if v is not None}
-
-        try:
-            logger.debug(f'base_url: {self.base_url}, endpoint: {endpoint}, params: {params}')
-            response = self.http_client.get(endpoint, params=params)
-            logger.debug(f'response in json: {response.json()}')
-            return response
-        except httpx.HTTPStatusError as e:
-            logger.error(f'HTTP status error occurred: {e.response.status_code} {e.response.text}')
-            raise
-        except httpx.RequestError as e:
-            logger.error(f'Request error occurred: {str(e)}')
-            raise
+        logger.debug('base_url: %s, endpoint: %s, params: %s', self.base_url, endpoint, params)
+        response = self.http_client.get(endpoint, params=params)
+        logger.debug('response status: %s', response.status_code)
+        if self.raise_for_status:
+            self._check(response)
+        return response
+
+    def _check(self, response: httpx.Response) -> None:
+        """Logs and raises httpx.HTTPStatusError if the response is a 4xx or 5xx."""
+        if response.is_error:
+            logger.error('HTTP status error occurred: %s %s', response.status_code, response.text)
+            response.raise_for_status()
+
+    def _load_list(self, adapter: TypeAdapter, model, content: bytes) -> list:
+        if not self.trust_server:
+            return adapter.validate_json(content)
+
+        # Trusted data is built with model_construct, skipping validation. The
+        # constructors are bound to locals once instead of looked up per row.
+        data = from_json(content)
+        construct = model.model_construct
+        nested = _NESTED_FIELDS.get(model)
+        if nested is not None:
+            field, item_model = nested
+            construct_item = item_model.model_construct
+            for it in data:
+                if field in it:
+                    it[field] = [construct_item(**item) for item in it[field]]
+        return [construct(**it) for it in data]
 
     def get_health_check(self) -> httpx.Response:
         """
@@ -129,15 +374,19 @@ class SWCClient:
         """
         logger.debug('Listing leagues...')
 
-        params = {
-            "skip": skip,
-            "limit": limit,
-            "min_last_changed_date": min_last_changed_date,
-            "league_name": league_name,
-        }
+        # Unset parameters are left out of the query string rather than sent empty.
+        params = {}
+        if skip is not None:
+            params["skip"] = skip
+        if limit is not None:
+            params["limit"] = limit
+        if min_last_changed_date is not None:
+            params["min_last_changed_date"] = min_last_changed_date
+        if league_name is not None:
+            params["league_name"] = league_name
 
         response = self.call_api(self.LIST_LEAGUES_ENDPOINT, params=params)
-        return [League(**it) for it in response.json()]
+        return self._load_list(_LEAGUES, League, response.content)
 
     def get_league_by_id(self, league_id: int) -> League:
         """Returns a Leagues matching a league_id.
@@ -150,10 +399,10 @@ class SWCClient:
         """
         logger.debug("Entered get league by ID")
         # build URL
-        endpoint_url = f"{self.LIST_LEAGUES_ENDPOINT}{league_id}"
+        endpoint_url = self._league_by_id_url(league_id)
         # make the API call
-        response = self.call_api(endpoint_url)
-        response_league = League(**response.json())
+        content = self._cached_get(endpoint_url, self.GET_BY_ID_CACHE_TTL)
+        response_league = League.model_validate_json(content)
         return response_league
 
     def get_counts(self) -> Counts:
@@ -167,8 +416,8 @@ class SWCClient:
         """
         logger.debug("Entered get counts")
 
-        response = self.call_api(self.GET_COUNTS_ENDPOINT)
-        counts = Counts(**response.json())
+        content = self._cached_get(self.GET_COUNTS_ENDPOINT, self.COUNTS_CACHE_TTL)
+        counts = Counts.model_validate_json(content)
         return counts
 
     def list_teams(
@@ -192,15 +441,19 @@ class SWCClient:
 
         logger.debug("Entered list teams")
 
-        params = {
-            "skip": skip,
-            "limit": limit,
-            "min_last_changed_date": min_last_changed_date,
-            "team_name": team_name,
-            "league_id": league_id,
-        }
+        params = {}
+        if skip is not None:
+            params["skip"] = skip
+        if limit is not None:
+            params["limit"] = limit
+        if min_last_changed_date is not None:
+            params["min_last_changed_date"] = min_last_changed_date
+        if team_name is not None:
+            params["team_name"] = team_name
+        if league_id is not None:
+            params["league_id"] = league_id
         response = self.call_api(self.LIST_TEAMS_ENDPOINT, params)
-        return [Team(**team) for team in response.json()]
+        return self._load_list(_TEAMS, Team, response.content)
 
     def list_players(
             self,
@@ -222,16 +475,20 @@ class SWCClient:
         """
         logger.debug("Entered list players")
 
-        params = {
-            "skip": skip,
-            "limit": limit,
-            "min_last_changed_date": min_last_changed_date,
-            "first_name": first_name,
-            "last_name": last_name,
-        }
+        params = {}
+        if skip is not None:
+            params["skip"] = skip
+        if limit is not None:
+            params["limit"] = limit
+        if min_last_changed_date is not None:
+            params["min_last_changed_date"] = min_last_changed_date
+        if first_name is not None:
+            params["first_name"] = first_name
+        if last_name is not None:
+            params["last_name"] = last_name
 
         response = self.call_api(self.LIST_PLAYERS_ENDPOINT, params)
-        return [Player(**player) for player in response.json()]
+        return self._load_list(_PLAYERS, Player, response.content)
 
     def get_player_by_id(self, player_id: int):
         """Returns a Players matching the SWC Player ID.
@@ -246,12 +503,64 @@ class SWCClient:
         logger.debug("Entered get player by ID")
 
         # build URL
-        endpoint_url = f"{self.LIST_PLAYERS_ENDPOINT}{player_id}"
+        endpoint_url = self._player_by_id_url(player_id)
         # make the API call
-        response = self.call_api(endpoint_url)
-        player = Player(**response.json())
+        content = self._cached_get(endpoint_url, self.GET_BY_ID_CACHE_TTL)
+        player = Player.model_validate_json(content)
         return player
 
+    async def _aget_player(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                           player_id: int) -> httpx.Response:
+        async with semaphore:
+            return await client.get(self._player_by_id_url(player_id))
+
+    async def _gather_players(self, player_ids: List[int]) -> List[httpx.Response]:
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        async with self._new_async_http_client() as client:
+            responses = await asyncio.gather(
+                *(self._aget_player(client, semaphore, player_id) for player_id in player_ids)
+            )
+        # checked once every request is done, so none is left running on a failure
+        for response in responses:
+            self._check(response)
+        return responses
+
+    def get_players_by_ids(self, player_ids: List[int]) -> List[Player]:
+        """Returns the Players matching a list of SWC Player IDs.
+
+        Serves cached players from memory and fetches the rest from the API
+        v0/players/{player_id} endpoint concurrently, with at most
+        MAX_CONCURRENT_REQUESTS requests in flight.
+        Must not be called from inside a running event loop.
+
+        Returns:
+        A List of schemas.Player objects in the same order as player_ids.
+
+        Raises:
+        httpx.HTTPStatusError: If any player could not be fetched, e.g. an
+            unknown player ID.
+
+        """
+        logger.debug("Entered get players by IDs")
+
+        contents = {}
+        missing = []
+        for player_id in dict.fromkeys(player_ids):
+            content = self._cache_get(self._player_by_id_url(player_id))
+            if content is None:
+                missing.append(player_id)
+            else:
+                contents[player_id] = content
+
+        if missing:
+            for player_id, response in zip(missing, asyncio.run(self._gather_players(missing))):
+                if response.status_code == 200:
+                    self._cache_set(self._player_by_id_url(player_id), response.content,
+                                    self.GET_BY_ID_CACHE_TTL)
+                contents[player_id] = response.content
+
+        return [Player.model_validate_json(contents[player_id]) for player_id in player_ids]
+
     def list_performances(
             self, skip: int = 0, limit: int = 100, min_last_changed_date: str = None
     ):
@@ -267,26 +576,114 @@ class SWCClient:
         """
         logger.debug("Entered get performances")
 
-        params = {
-            "skip": skip,
-            "limit": limit,
-            "min_last_changed_date": min_last_changed_date,
-        }
+        params = {}
+        if skip is not None:
+            params["skip"] = skip
+        if limit is not None:
+            params["limit"] = limit
+        if min_last_changed_date is not None:
+            params["min_last_changed_date"] = min_last_changed_date
 
         response = self.call_api(self.LIST_PERFORMANCES_ENDPOINT, params)
-        return [Performance(**it) for it in response.json()]
+        return self._load_list(_PERFORMANCES, Performance, response.content)
 
     def __get_bulk_file(self, key: str) -> bytes:
-        logger.debug(f"Entered get bulk {key} file")
+        logger.debug("Entered get bulk %s file", key)
 
-        player_file_path = self.BULK_FILE_BASE_URL + self.BULK_FILE_NAMES[key]
+        file_name = self.BULK_FILE_NAMES[key]
+        content = self._cache_get(file_name)
+        if content is not None:
+            return content
 
-        response = httpx.get(player_file_path, follow_redirects=True)
+        response = self.bulk_http_client.get(file_name)
+        if self.raise_for_status:
+            self._check(response)
 
         if response.status_code == 200:
             logger.debug("File downloaded successfully")
+            self._cache_set(file_name, response.content, self.BULK_FILE_CACHE_TTL)
         return response.content
 
+    def iter_bulk_file(self, key: str, chunk_size: int = BULK_FILE_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yields a bulk file in chunks as it downloads.
+
+        Streams the file instead of loading it into memory, so consumers can
+        start processing before the download finishes.
+
+        Args:
+        key:
+            The bulk file to download: players, leagues, performances,
+            teams or team_players.
+        chunk_size:
+            The number of bytes in each chunk.
+
+        Raises:
+        httpx.HTTPStatusError: If the file could not be downloaded.
+
+        """
+        logger.debug("Entered iter bulk %s file", key)
+
+        with self.bulk_http_client.stream("GET", self.BULK_FILE_NAMES[key]) as response:
+            response.raise_for_status()
+            yield from response.iter_bytes(chunk_size)
+
+    def download_bulk_file(self, key: str, path) -> None:
+        """Streams a bulk file to disk without holding it in memory.
+
+        Args:
+        key:
+            The bulk file to download: players, leagues, performances,
+            teams or team_players.
+        path:
+            The file path to write to.
+
+        """
+        with open(path, 'wb') as f:
+            for chunk in self.iter_bulk_file(key):
+                f.write(chunk)
+
+    async def _gather_bulk_files(self, file_names: List[str]) -> List[bytes]:
+        async with self._new_async_bulk_http_client() as client:
+            responses = await asyncio.gather(*(client.get(name) for name in file_names))
+        # checked once every download is done, so none is left running on a failure
+        for response in responses:
+            self._check(response)
+        return [response.content for response in responses]
+
+    def get_all_bulk_files(self) -> Dict[str, bytes]:
+        """Returns all bulk files, downloaded concurrently.
+
+        Serves cached files from memory and fetches the rest in parallel
+        instead of one after another, sharing the cache used by the
+        get_bulk_*_file methods.
+        Must not be called from inside a running event loop.
+
+        Returns:
+        A dict mapping each bulk file key (players, leagues, performances,
+        teams, team_players) to the file contents.
+
+        Raises:
+        httpx.HTTPStatusError: If any file could not be downloaded.
+
+        """
+        logger.debug("Entered get all bulk files")
+
+        files = {}
+        missing = []
+        for file_name in self.BULK_FILE_NAMES.values():
+            content = self._cache_get(file_name)
+            if content is None:
+                missing.append(file_name)
+            else:
+                files[file_name] = content
+
+        if missing:
+            for file_name, content in zip(missing, asyncio.run(self._gather_bulk_files(missing))):
+                self._cache_set(file_name, content, self.BULK_FILE_CACHE_TTL)
+                files[file_name] = content
+
+        return {key: files[file_name] for key, file_name in self.BULK_FILE_NAMES.items()}
+
     def get_bulk_player_file(self) -> bytes:
         """Returns a bulk file with player data"""
 
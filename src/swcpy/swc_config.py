@@ -1,9 +1,12 @@
+import logging
 import os
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class SWCConfig:
     """Configuration class containing arguments for the SDK client.
@@ -15,8 +18,12 @@ class SWCConfig:
     swc_backoff: bool
     swc_backoff_max_time: int
     swc_bulk_file_format: str
+    swc_cache: bool
+    swc_trust_server: bool
+    swc_raise_for_status: bool
 
-    def __init__(self, base_url: str = None, backoff: bool = True, backoff_max_time: int = 30, bulk_file_format: str = 'csv'):
+    def __init__(self, base_url: str = None, backoff: bool = True, backoff_max_time: int = 30, bulk_file_format: str = 'csv',
+                 cache: bool = True, trust_server: bool = False, raise_for_status: bool = False):
         """Constructor for configuration class.
 
         Contains initialization values to overwrite defaults.
@@ -30,10 +37,19 @@ class SWCConfig:
             The max number of seconds the SDK should keep trying an API call before stopping.
         swc_bulk_file_format:
             If bulk files should be in csv or parquet format.
+        swc_cache:
+            A boolean that determines if the SDK should cache counts, single-item lookups and bulk files in memory.
+        swc_trust_server:
+            A boolean that determines if list responses are built without validation. Faster, but fields keep
+            their JSON types (for example, dates stay strings).
+        swc_raise_for_status:
+            A boolean that determines if API calls and the get_bulk_*_file methods raise httpx.HTTPStatusError
+            for 4xx and 5xx responses.
+            get_players_by_ids and get_all_bulk_files always raise, since an error body is not usable data.
         """
 
         self.swc_base_url = base_url or os.getenv('SWC_API_BASE_URL')
-        print(f'SWC_API_BASE_URL in SWCConfig init: {self.swc_base_url}')
+        logger.debug('SWC_API_BASE_URL in SWCConfig init: %s', self.swc_base_url)
 
         if not self.swc_base_url:
             raise ValueError('Base URL is required. set SWC_API_BASE_URL environment variable.')
@@ -41,6 +57,9 @@ class SWCConfig:
         self.swc_backoff = backoff
         self.swc_backoff_max_time = backoff_max_time
         self.swc_bulk_file_format = bulk_file_format
+        self.swc_cache = cache
+        self.swc_trust_server = trust_server
+        self.swc_raise_for_status = raise_for_status
 
     def __str__(self):
         """Stringify function to return contents of config object for logging"""
@@ -3,15 +3,25 @@
 import pytest
 from unittest.mock import Mock
 import httpx
-from datetime import datetime
 
 from swcpy.swc_config import SWCConfig
 from swcpy.swc_client import SWCClient
 
 
-@pytest.fixture
-def sample_config():
-    """Create a sample configuration for testing."""
+def _handler(request):
+    """Answer any request with an empty JSON object."""
+    return httpx.Response(200, json={})
+
+
+@pytest.fixture(scope="session")
+def mock_transport():
+    """Serve requests in memory, so clients open no sockets, pools or TLS contexts."""
+    return httpx.MockTransport(_handler)
+
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """Create a sample configuration shared by the whole test session."""
     return SWCConfig(
         base_url="https://api.test.com",
         backoff=False,
@@ -21,15 +31,16 @@ def sample_config():
 
 
 @pytest.fixture
-def sample_client(sample_config):
-    """Create a sample client for testing."""
-    return SWCClient(sample_config)
+def fresh_client(mock_config, mock_transport):
+    """Create a new client for tests that need one of their own."""
+    with SWCClient(mock_config, transport=mock_transport, async_transport=mock_transport) as client:
+        yield client
 
 
 @pytest.fixture
 def mock_http_response():
     """Create a mock HTTP response."""
-    response = Mock(spec=httpx.Response)
+    response = Mock()
     response.status_code = 200
     response.json.return_value = {"status": "ok"}
     return response
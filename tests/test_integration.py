@@ -4,13 +4,15 @@ These tests verify the integration between different components
 and can be run against a real API if needed.
 """
 
+import json
+
 import pytest
 from unittest.mock import patch, Mock
 import httpx
 
 from swcpy.swc_client import SWCClient
 from swcpy.swc_config import SWCConfig
-from swcpy.schemas import League, Team, Player, Performance, Counts
+from swcpy.schemas import League, Team
 
 
 class TestSWCClientIntegration:
@@ -36,7 +38,7 @@ class TestSWCClientIntegration:
         """Test a complete workflow: list leagues, then get teams for a league."""
         # Mock league response
         league_response = Mock()
-        league_response.json.return_value = [
+        league_response.content = json.dumps([
             {
                 "league_id": 1,
                 "league_name": "Test League",
@@ -44,11 +46,11 @@ class TestSWCClientIntegration:
                 "last_changed_date": "2024-01-01T00:00:00",
                 "teams": []
             }
-        ]
+        ]).encode()
         
         # Mock team response
         team_response = Mock()
-        team_response.json.return_value = [
+        team_response.content = json.dumps([
             {
                 "league_id": 1,
                 "team_id": 1,
@@ -56,7 +58,7 @@ class TestSWCClientIntegration:
                 "last_changed_date": "2024-01-01T00:00:00",
                 "players": []
             }
-        ]
+        ]).encode()
         
         # Configure mock to return different responses for different calls
         mock_get.side_effect = [league_response, team_response]
@@ -91,7 +93,7 @@ class TestSWCClientIntegration:
         with pytest.raises(httpx.HTTPStatusError):
             integration_client.get_health_check()
 
-    @patch('swcpy.swc_client.httpx.get')
+    @patch('swcpy.swc_client.httpx.Client.get')
     def test_bulk_file_download_workflow(self, mock_bulk_get, integration_client):
         """Test downloading multiple bulk files."""
         mock_response = Mock()
@@ -110,9 +112,9 @@ class TestSWCClientIntegration:
         
         # Verify correct URLs were called
         expected_calls = [
-            f"{integration_client.BULK_FILE_BASE_URL}player_data.csv",
-            f"{integration_client.BULK_FILE_BASE_URL}league_data.csv",
-            f"{integration_client.BULK_FILE_BASE_URL}performance_data.csv"
+            "player_data.csv",
+            "league_data.csv",
+            "performance_data.csv"
         ]
         
         actual_calls = [call[0][0] for call in mock_bulk_get.call_args_list]
@@ -141,7 +143,7 @@ class TestSWCClientIntegration:
     def test_parameter_filtering_integration(self, mock_get, integration_client):
         """Test that None parameters are properly filtered in real scenarios."""
         mock_response = Mock()
-        mock_response.json.return_value = []
+        mock_response.content = b"[]"
         mock_get.return_value = mock_response
         
         # Call with mix of None and valid parameters
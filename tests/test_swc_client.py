@@ -1,41 +1,127 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 import httpx
-from datetime import datetime
+import respx
+from pydantic_core import from_json
 
 from swcpy.swc_client import SWCClient
 from swcpy.swc_config import SWCConfig
-from swcpy.schemas import League, Team, Player, Performance, Counts
+from swcpy.schemas import League, Team, TeamBase, Player, Performance, Counts
 
+_STATUS_ERR = httpx.HTTPStatusError(
+    "Bad Request", request=Mock(), response=Mock(status_code=400, text="Bad Request")
+)
+_REQ_ERR = httpx.RequestError("Connection failed")
+_BASE_URL = "https://api.test.com"
+_SAMPLE_DIR = Path(__file__).parent / "fixtures"
+# Endpoint path and the file holding the sample response body served for it.
+_API_SAMPLES = (
+    ("/v0/leagues/", "leagues"),
+    ("/v0/leagues/1", "league_1"),
+    ("/v0/teams/", "teams"),
+    ("/v0/players/", "players"),
+    ("/v0/players/1", "player_1"),
+    ("/v0/performances/", "performances"),
+    ("/v0/counts/", "counts"),
+)
+_BULK_FILE_STEMS = (
+    ('players', 'player_data'),
+    ('leagues', 'league_data'),
+    ('performances', 'performance_data'),
+    ('teams', 'team_data'),
+    ('team_players', 'team_player_data'),
+)
+_BULK_FILES = {
+    "player_data.csv": b"a,b\n1,2\n",
+    "league_data.csv": b"league,data",
+    "performance_data.csv": b"performance,data",
+    "team_data.csv": b"team,data",
+    "team_player_data.csv": b"team_player,data",
+}
 
-class TestSWCClient:
-    """Test suite for SWCClient class."""
+# Raw sample bodies, read once; the payload dicts are decoded from them.
+_SAMPLE_BODIES = {
+    name: (_SAMPLE_DIR / f"{name}.json").read_bytes() for _, name in _API_SAMPLES
+}
+LEAGUE_FIXTURE = from_json(_SAMPLE_BODIES["league_1"])
+TEAM_FIXTURE = from_json(_SAMPLE_BODIES["teams"])[0]
+PLAYER_FIXTURE = from_json(_SAMPLE_BODIES["player_1"])
+PERFORMANCE_FIXTURE = from_json(_SAMPLE_BODIES["performances"])[0]
+COUNTS_FIXTURE = from_json(_SAMPLE_BODIES["counts"])
+EXPECTED_LEAGUE = League.model_validate(LEAGUE_FIXTURE)
+EXPECTED_TEAM = Team.model_validate(TEAM_FIXTURE)
+EXPECTED_PLAYER = Player.model_validate(PLAYER_FIXTURE)
+EXPECTED_PERFORMANCE = Performance.model_validate(PERFORMANCE_FIXTURE)
+EXPECTED_COUNTS = Counts.model_validate(COUNTS_FIXTURE)
 
-    @pytest.fixture
-    def mock_config(self):
-        """Create a mock configuration for testing."""
-        return SWCConfig(
-            base_url="https://api.test.com",
-            backoff=False,
-            backoff_max_time=30,
-            bulk_file_format="csv"
+UNKNOWN_PLAYER_ID = 404
+
+
+def _player_response(request, player_id):
+    player_id = int(player_id)
+    if player_id == UNKNOWN_PLAYER_ID:
+        return httpx.Response(404, json={"detail": "Player not found"})
+    return httpx.Response(
+        200, json={**PLAYER_FIXTURE, "player_id": player_id, "gsis_id": f"test{player_id}"}
+    )
+
+
+@pytest.fixture(scope="class")
+def router():
+    """Mock every HTTP route the tests hit, once for the whole class."""
+    router = respx.Router(assert_all_called=False)
+    router.get(_BASE_URL + "/", name="health").respond(
+        200, json={"message": "API health check successful"}
+    )
+    router.get(_BASE_URL + "/ok", name="ok").respond(200, json={"status": "ok"})
+    router.get(_BASE_URL + "/status-error").mock(side_effect=_STATUS_ERR)
+    router.get(_BASE_URL + "/request-error").mock(side_effect=_REQ_ERR)
+    router.get(_BASE_URL + "/missing").respond(404)
+    for path, name in _API_SAMPLES:
+        router.get(_BASE_URL + path, name=name).respond(200, content=_SAMPLE_BODIES[name])
+    # Any other player ID is found, except UNKNOWN_PLAYER_ID.
+    router.get(url__regex=_BASE_URL + r"/v0/players/(?P<player_id>\d+)$", name="player").mock(
+        side_effect=_player_response
+    )
+    for filename, payload in _BULK_FILES.items():
+        router.get(SWCClient.BULK_FILE_BASE_URL + filename, name=filename).respond(
+            200, content=payload
         )
+    return router
+
 
-    @pytest.fixture
-    def client(self, mock_config):
-        """Create a SWCClient instance for testing."""
-        return SWCClient(mock_config)
+def _routed_client(config, router):
+    """Create a client whose sync and async requests are answered by router."""
+    transport = httpx.MockTransport(router.handler)
+    return SWCClient(config, transport=transport, async_transport=transport)
 
-    @pytest.fixture
-    def mock_response(self):
-        """Create a mock HTTP response."""
-        response = Mock(spec=httpx.Response)
-        response.status_code = 200
-        return response
 
-    def test_init_with_backoff_disabled(self, mock_config):
+@pytest.fixture(scope="class")
+def routed_client(mock_config, router):
+    """Create a client whose requests are answered by the router."""
+    with _routed_client(mock_config, router) as client:
+        yield client
+
+
+class TestSWCClient:
+    """Test suite for SWCClient class."""
+
+    @pytest.fixture(autouse=True)
+    def reset_router(self, router, routed_client):
+        """Undo per-test route overrides and clear the call and response history."""
+        router.snapshot()
+        yield
+        router.rollback()
+        router.reset()
+        routed_client.invalidate()
+
+    def test_init_with_backoff_disabled(self, mock_config, mock_transport):
         """Test client initialization with backoff disabled."""
-        client = SWCClient(mock_config)
+        client = SWCClient(mock_config, transport=mock_transport)
         
         assert client.base_url == "https://api.test.com"
         assert client.backoff is False
@@ -43,7 +129,7 @@ class TestSWCClient:
         assert client.bulk_file_format == "csv"
         assert isinstance(client.http_client, httpx.Client)
 
-    def test_init_with_backoff_enabled(self):
+    def test_init_with_backoff_enabled(self, mock_transport):
         """Test client initialization with backoff enabled."""
         config = SWCConfig(
             base_url="https://api.test.com",
@@ -51,331 +137,445 @@ class TestSWCClient:
             backoff_max_time=60,
             bulk_file_format="parquet"
         )
-        client = SWCClient(config)
+        client = SWCClient(config, transport=mock_transport)
         
         assert client.backoff is True
         assert client.backoff_max_time == 60
         assert client.bulk_file_format == "parquet"
 
-    def test_bulk_file_names_csv_format(self, client):
-        """Test bulk file names are correctly formatted for CSV."""
-        expected_names = {
-            'players': 'player_data.csv',
-            'leagues': 'league_data.csv',
-            'performances': 'performance_data.csv',
-            'teams': 'team_data.csv',
-            'team_players': 'team_player_data.csv',
-        }
-        assert client.BULK_FILE_NAMES == expected_names
+    def test_backoff_uses_full_jitter(self, mock_transport):
+        """Test that retry waits grow exponentially with full jitter."""
+        config = SWCConfig(
+            base_url="https://api.test.com",
+            backoff=True,
+            backoff_max_time=60
+        )
+        client = SWCClient(config, transport=mock_transport)
+        retry = client.http_client._transport.retry
+
+        random.seed(1234)
+        delays = []
+        for attempt in range(1, 6):
+            retry = retry.increment()
+            delay = retry.backoff_strategy()
+            assert 0 <= delay <= client.BACKOFF_FACTOR * 2 ** attempt
+            delays.append(delay)
 
-    def test_bulk_file_names_parquet_format(self):
-        """Test bulk file names are correctly formatted for Parquet."""
+        # jittered waits are not the bare exponential sequence
+        assert delays != [client.BACKOFF_FACTOR * 2 ** n for n in range(1, 6)]
+
+    @pytest.mark.parametrize("bulk_file_format", ["csv", "parquet"])
+    def test_bulk_file_names_format(self, mock_transport, bulk_file_format):
+        """Test bulk file names carry the configured file extension."""
         config = SWCConfig(
             base_url="https://api.test.com",
-            bulk_file_format="parquet"
+            bulk_file_format=bulk_file_format
         )
-        client = SWCClient(config)
-        
-        expected_names = {
-            'players': 'player_data.parquet',
-            'leagues': 'league_data.parquet',
-            'performances': 'performance_data.parquet',
-            'teams': 'team_data.parquet',
-            'team_players': 'team_player_data.parquet',
+        client = SWCClient(config, transport=mock_transport)
+
+        assert client.BULK_FILE_NAMES == {
+            key: f"{stem}.{bulk_file_format}" for key, stem in _BULK_FILE_STEMS
         }
-        assert client.BULK_FILE_NAMES == expected_names
 
-    @patch('swcpy.swc_client.httpx.Client.get')
-    def test_call_api_success(self, mock_get, client, mock_response):
+    def test_bulk_file_names_shared_between_clients(self, routed_client, mock_config,
+                                                    mock_transport):
+        """Test that clients with the same format share one read-only mapping."""
+        with SWCClient(mock_config, transport=mock_transport) as other:
+            assert other.BULK_FILE_NAMES is routed_client.BULK_FILE_NAMES
+        with pytest.raises(TypeError):
+            routed_client.BULK_FILE_NAMES['players'] = 'other.csv'
+
+    def test_call_api_success(self, routed_client, router):
         """Test successful API call."""
-        mock_response.json.return_value = {"status": "ok"}
-        mock_get.return_value = mock_response
-        
-        result = client.call_api("/test", {"param": "value"})
+        result = routed_client.call_api("/ok", {"param": "value"})
         
-        mock_get.assert_called_once_with("/test", params={"param": "value"})
-        assert result == mock_response
-
-    @patch('swcpy.swc_client.httpx.Client.get')
-    def test_call_api_filters_none_params(self, mock_get, client, mock_response):
-        """Test that None parameters are filtered out."""
-        mock_response.json.return_value = {"status": "ok"}
-        mock_get.return_value = mock_response
-        
-        client.call_api("/test", {"param1": "value", "param2": None})
-        
-        mock_get.assert_called_once_with("/test", params={"param1": "value"})
+        route = router.routes["ok"]
+        assert route.call_count == 1
+        assert route.calls.last.request.url.params == httpx.QueryParams({"param": "value"})
+        assert result.json() == {"status": "ok"}
 
-    @patch('swcpy.swc_client.httpx.Client.get')
-    def test_call_api_http_status_error(self, mock_get, client):
+    def test_call_api_http_status_error(self, routed_client):
         """Test API call with HTTP status error."""
-        mock_get.side_effect = httpx.HTTPStatusError(
-            "Bad Request", request=Mock(), response=Mock(status_code=400, text="Bad Request")
-        )
-        
         with pytest.raises(httpx.HTTPStatusError):
-            client.call_api("/test")
+            routed_client.call_api("/status-error")
 
-    @patch('swcpy.swc_client.httpx.Client.get')
-    def test_call_api_request_error(self, mock_get, client):
+    def test_call_api_request_error(self, routed_client):
         """Test API call with request error."""
-        mock_get.side_effect = httpx.RequestError("Connection failed")
-        
         with pytest.raises(httpx.RequestError):
-            client.call_api("/test")
+            routed_client.call_api("/request-error")
 
-    @patch.object(SWCClient, 'call_api')
-    def test_get_health_check(self, mock_call_api, client, mock_response):
+    def test_call_api_returns_error_response_by_default(self, routed_client):
+        """Test that error responses are returned unless raise_for_status is set."""
+        result = routed_client.call_api("/missing")
+
+        assert result.status_code == 404
+
+    def test_call_api_raise_for_status(self, router):
+        """Test that raise_for_status turns error responses into exceptions."""
+        config = SWCConfig(
+            base_url="https://api.test.com",
+            backoff=False,
+            raise_for_status=True
+        )
+        client = _routed_client(config, router)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.call_api("/missing")
+
+    def test_get_bulk_file_raise_for_status(self, router):
+        """Test that raise_for_status turns a failed bulk download into an exception."""
+        config = SWCConfig(
+            base_url="https://api.test.com",
+            backoff=False,
+            raise_for_status=True
+        )
+        router.routes["player_data.csv"].respond(404, content=b"404: Not Found")
+
+        with _routed_client(config, router) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client.get_bulk_player_file()
+
+    @pytest.mark.parametrize("raise_for_status", [True, False])
+    def test_batch_calls_always_raise(self, router, raise_for_status):
+        """Test that the concurrent batch calls raise on errors whatever raise_for_status says."""
+        config = SWCConfig(
+            base_url="https://api.test.com",
+            backoff=False,
+            raise_for_status=raise_for_status
+        )
+        router.routes["league_data.csv"].respond(500)
+
+        with _routed_client(config, router) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client.get_players_by_ids([UNKNOWN_PLAYER_ID])
+            with pytest.raises(httpx.HTTPStatusError):
+                client.get_all_bulk_files()
+
+    def test_get_health_check(self, routed_client, router):
         """Test health check endpoint."""
-        mock_call_api.return_value = mock_response
-        
-        result = client.get_health_check()
+        result = routed_client.get_health_check()
         
-        mock_call_api.assert_called_once_with("/")
-        assert result == mock_response
+        assert router.routes["health"].call_count == 1
+        assert result.status_code == 200
 
-    @patch.object(SWCClient, 'call_api')
-    def test_list_leagues(self, mock_call_api, client):
+    def test_list_leagues(self, routed_client, router):
         """Test listing leagues."""
-        mock_response_data = [
-            {
-                "league_id": 1,
-                "league_name": "Test League",
-                "scoring_type": "standard",
-                "last_changed_date": "2024-01-01T00:00:00",
-                "teams": []
-            }
-        ]
-        mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
-        mock_call_api.return_value = mock_response
-        
-        result = client.list_leagues(skip=10, limit=50, league_name="Test")
+        result = routed_client.list_leagues(skip=10, limit=50, league_name="Test")
         
         expected_params = {
             "skip": 10,
             "limit": 50,
-            "min_last_changed_date": None,
             "league_name": "Test"
         }
-        mock_call_api.assert_called_once_with("/v0/leagues/", params=expected_params)
-        assert len(result) == 1
+        request = router.routes["leagues"].calls.last.request
+        assert request.url.params == httpx.QueryParams(expected_params)
+        assert result == [EXPECTED_LEAGUE]
+
+    @pytest.mark.parametrize("method_name,route_name", [
+        ("list_leagues", "leagues"),
+        ("list_teams", "teams"),
+        ("list_players", "players"),
+        ("list_performances", "performances"),
+    ])
+    def test_list_leaves_out_unset_paging(self, routed_client, router, method_name, route_name):
+        """Test that skip and limit passed as None are left out of the query string."""
+        getattr(routed_client, method_name)(skip=None, limit=None)
+
+        request = router.routes[route_name].calls.last.request
+        assert request.url.query == b""
+
+    def test_list_leagues_trust_server(self, router):
+        """Test that trusted list responses are built without validation."""
+        config = SWCConfig(
+            base_url="https://api.test.com",
+            backoff=False,
+            trust_server=True
+        )
+        router.routes["leagues"].respond(200, json=[{**LEAGUE_FIXTURE, "teams": [TEAM_FIXTURE]}])
+
+        with _routed_client(config, router) as client:
+            result = client.list_leagues()
+
         assert isinstance(result[0], League)
-        assert result[0].league_name == "Test League"
+        assert isinstance(result[0].teams[0], TeamBase)
+        assert result[0].teams[0].team_name == "Test Team"
+        # no validation ran, so the date keeps its JSON type
+        assert result[0].last_changed_date == "2024-01-01T00:00:00"
 
-    @patch.object(SWCClient, 'call_api')
-    def test_get_league_by_id(self, mock_call_api, client):
+    def test_get_league_by_id(self, routed_client, router):
         """Test getting league by ID."""
-        mock_response_data = {
-            "league_id": 1,
-            "league_name": "Test League",
-            "scoring_type": "standard",
-            "last_changed_date": "2024-01-01T00:00:00",
-            "teams": []
-        }
-        mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
-        mock_call_api.return_value = mock_response
-        
-        result = client.get_league_by_id(1)
+        result = routed_client.get_league_by_id(1)
         
-        mock_call_api.assert_called_once_with("/v0/leagues/1")
-        assert isinstance(result, League)
-        assert result.league_id == 1
+        assert router.routes["league_1"].call_count == 1
+        assert result == EXPECTED_LEAGUE
 
-    @patch.object(SWCClient, 'call_api')
-    def test_get_counts(self, mock_call_api, client):
+    def test_get_counts(self, routed_client, router):
         """Test getting counts."""
-        mock_response_data = {
-            "league_count": 10,
-            "team_count": 100,
-            "player_count": 1000
-        }
-        mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
-        mock_call_api.return_value = mock_response
-        
-        result = client.get_counts()
+        result = routed_client.get_counts()
         
-        mock_call_api.assert_called_once_with("/v0/counts/")
-        assert isinstance(result, Counts)
-        assert result.league_count == 10
+        assert router.routes["counts"].call_count == 1
+        assert result == EXPECTED_COUNTS
+
+    def test_get_counts_uses_cache(self, routed_client, router):
+        """Test that counts are served from cache until invalidated."""
+        routed_client.get_counts()
+        routed_client.get_counts()
+        assert router.routes["counts"].call_count == 1
+
+        routed_client.invalidate()
+        routed_client.get_counts()
+        assert router.routes["counts"].call_count == 2
+
+    def test_cached_response_expires(self, routed_client, router, monkeypatch):
+        """Test that a cached response is refetched once its TTL passes."""
+        mock_monotonic = Mock(return_value=0)
+        monkeypatch.setattr("swcpy.swc_client.time.monotonic", mock_monotonic)
+        routed_client.get_counts()
+        mock_monotonic.return_value = routed_client.COUNTS_CACHE_TTL + 1
+        routed_client.get_counts()
+
+        assert router.routes["counts"].call_count == 2
 
-    @patch.object(SWCClient, 'call_api')
-    def test_list_teams(self, mock_call_api, client):
+    def test_cache_evicts_least_recently_used(self, fresh_client, monkeypatch):
+        """Test that a full cache drops the entry read least recently."""
+        monkeypatch.setattr(SWCClient, "CACHE_MAX_SIZE", 2)
+        fresh_client._cache_set("first", b"1", 60)
+        fresh_client._cache_set("second", b"2", 60)
+
+        fresh_client._cache_get("first")
+        fresh_client._cache_set("third", b"3", 60)
+
+        assert fresh_client._cache_get("first") == b"1"
+        assert fresh_client._cache_get("second") is None
+        assert fresh_client._cache_get("third") == b"3"
+
+    def test_cache_disabled(self, router):
+        """Test that disabling the cache always calls the API."""
+        config = SWCConfig(
+            base_url="https://api.test.com",
+            backoff=False,
+            cache=False
+        )
+
+        with _routed_client(config, router) as client:
+            client.get_counts()
+            client.get_counts()
+
+        assert router.routes["counts"].call_count == 2
+
+    def test_list_teams(self, routed_client, router):
         """Test listing teams."""
-        mock_response_data = [
-            {
-                "league_id": 1,
-                "team_id": 1,
-                "team_name": "Test Team",
-                "last_changed_date": "2024-01-01T00:00:00",
-                "players": []
-            }
-        ]
-        mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
-        mock_call_api.return_value = mock_response
-        
-        result = client.list_teams(league_id=1, team_name="Test")
+        result = routed_client.list_teams(league_id=1, team_name="Test")
         
         expected_params = {
             "skip": 0,
             "limit": 100,
-            "min_last_changed_date": None,
             "team_name": "Test",
             "league_id": 1
         }
-        mock_call_api.assert_called_once_with("/v0/teams/", expected_params)
-        assert len(result) == 1
-        assert isinstance(result[0], Team)
+        request = router.routes["teams"].calls.last.request
+        assert request.url.params == httpx.QueryParams(expected_params)
+        assert result == [EXPECTED_TEAM]
 
-    @patch.object(SWCClient, 'call_api')
-    def test_list_players(self, mock_call_api, client):
+    def test_list_players(self, routed_client, router):
         """Test listing players."""
-        mock_response_data = [
-            {
-                "player_id": 1,
-                "gsis_id": "test123",
-                "first_name": "John",
-                "last_name": "Doe",
-                "position": "QB",
-                "last_changed_date": "2024-01-01T00:00:00",
-                "performances": []
-            }
-        ]
-        mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
-        mock_call_api.return_value = mock_response
-        
-        result = client.list_players(first_name="John", last_name="Doe")
+        result = routed_client.list_players(first_name="John", last_name="Doe")
         
         expected_params = {
             "skip": 0,
             "limit": 100,
-            "min_last_changed_date": None,
             "first_name": "John",
             "last_name": "Doe"
         }
-        mock_call_api.assert_called_once_with("/v0/players/", expected_params)
-        assert len(result) == 1
-        assert isinstance(result[0], Player)
+        request = router.routes["players"].calls.last.request
+        assert request.url.params == httpx.QueryParams(expected_params)
+        assert result == [EXPECTED_PLAYER]
 
-    @patch.object(SWCClient, 'call_api')
-    def test_get_player_by_id(self, mock_call_api, client):
+    def test_get_player_by_id(self, routed_client, router):
         """Test getting player by ID."""
-        mock_response_data = {
-            "player_id": 1,
-            "gsis_id": "test123",
-            "first_name": "John",
-            "last_name": "Doe",
-            "position": "QB",
-            "last_changed_date": "2024-01-01T00:00:00",
-            "performances": []
-        }
-        mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
-        mock_call_api.return_value = mock_response
+        result = routed_client.get_player_by_id(1)
         
-        result = client.get_player_by_id(1)
-        
-        mock_call_api.assert_called_once_with("/v0/players/1")
-        assert isinstance(result, Player)
-        assert result.player_id == 1
+        assert router.routes["player_1"].call_count == 1
+        assert result == EXPECTED_PLAYER
+
+    def test_get_players_by_ids(self, routed_client, router):
+        """Test fetching several players concurrently, reusing cached ones."""
+        routed_client.get_player_by_id(1)
+        result = routed_client.get_players_by_ids([3, 1, 2, 3])
+
+        assert [player.player_id for player in result] == [3, 1, 2, 3]
+        assert all(isinstance(player, Player) for player in result)
+        assert router.routes["player_1"].call_count == 1
+        fetched = sorted(call.request.url.path for call in router.routes["player"].calls)
+        assert fetched == ["/v0/players/2", "/v0/players/3"]
+
+    def test_get_players_by_ids_from_threads(self, routed_client, router):
+        """Test that threads sharing one client can run batch calls at once."""
+        player_ids = list(range(2, 10))
+        with ThreadPoolExecutor(max_workers=len(player_ids)) as executor:
+            results = list(executor.map(
+                lambda player_id: routed_client.get_players_by_ids([player_id]), player_ids
+            ))
 
-    @patch.object(SWCClient, 'call_api')
-    def test_list_performances(self, mock_call_api, client):
+        assert [players[0].player_id for players in results] == player_ids
+        assert router.routes["player"].call_count == len(player_ids)
+
+    def test_batch_calls_use_async_transport(self, mock_config, router):
+        """Test that batch calls go through async_transport and leave the sync one open."""
+        async_requests = []
+
+        def async_handler(request):
+            async_requests.append(request)
+            return router.handler(request)
+
+        sync_transport = httpx.MockTransport(router.handler)
+        async_transport = httpx.MockTransport(async_handler)
+        with SWCClient(mock_config, transport=sync_transport,
+                       async_transport=async_transport) as client:
+            client.get_players_by_ids([2])
+
+            assert client.http_client._transport is sync_transport
+            assert [request.url.path for request in async_requests] == ["/v0/players/2"]
+            assert client.call_api("/ok").status_code == 200
+
+    def test_get_players_by_ids_raises_on_unknown_id(self, routed_client):
+        """Test that a missing player fails with an HTTP error, not a validation error."""
+        with pytest.raises(httpx.HTTPStatusError):
+            routed_client.get_players_by_ids([2, UNKNOWN_PLAYER_ID])
+
+    def test_list_performances(self, routed_client, router):
         """Test listing performances."""
-        mock_response_data = [
-            {
-                "performance_id": 1,
-                "player_id": 1,
-                "week_number": "1",
-                "fantasy_points": 15.5,
-                "last_changed_date": "2024-01-01T00:00:00"
-            }
-        ]
-        mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
-        mock_call_api.return_value = mock_response
-        
-        result = client.list_performances(skip=5, limit=25)
+        result = routed_client.list_performances(skip=5, limit=25)
         
         expected_params = {
             "skip": 5,
-            "limit": 25,
-            "min_last_changed_date": None
+            "limit": 25
         }
-        mock_call_api.assert_called_once_with("/v0/performances/", expected_params)
-        assert len(result) == 1
-        assert isinstance(result[0], Performance)
-
-    @patch('swcpy.swc_client.httpx.get')
-    def test_get_bulk_player_file(self, mock_get, client):
-        """Test getting bulk player file."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"test,data"
-        mock_get.return_value = mock_response
-        
-        result = client.get_bulk_player_file()
-        
-        expected_url = client.BULK_FILE_BASE_URL + "player_data.csv"
-        mock_get.assert_called_once_with(expected_url, follow_redirects=True)
-        assert result == b"test,data"
-
-    @patch('swcpy.swc_client.httpx.get')
-    def test_get_bulk_league_file(self, mock_get, client):
-        """Test getting bulk league file."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"league,data"
-        mock_get.return_value = mock_response
-        
-        result = client.get_bulk_league_file()
-        
-        expected_url = client.BULK_FILE_BASE_URL + "league_data.csv"
-        mock_get.assert_called_once_with(expected_url, follow_redirects=True)
-        assert result == b"league,data"
-
-    @patch('swcpy.swc_client.httpx.get')
-    def test_get_bulk_performance_file(self, mock_get, client):
-        """Test getting bulk performance file."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"performance,data"
-        mock_get.return_value = mock_response
-        
-        result = client.get_bulk_performance_file()
-        
-        expected_url = client.BULK_FILE_BASE_URL + "performance_data.csv"
-        mock_get.assert_called_once_with(expected_url, follow_redirects=True)
-        assert result == b"performance,data"
-
-    @patch('swcpy.swc_client.httpx.get')
-    def test_get_bulk_team_file(self, mock_get, client):
-        """Test getting bulk team file."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"team,data"
-        mock_get.return_value = mock_response
-        
-        result = client.get_bulk_team_file()
-        
-        expected_url = client.BULK_FILE_BASE_URL + "team_data.csv"
-        mock_get.assert_called_once_with(expected_url, follow_redirects=True)
-        assert result == b"team,data"
-
-    @patch('swcpy.swc_client.httpx.get')
-    def test_get_bulk_team_player_file(self, mock_get, client):
-        """Test getting bulk team player file."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"team_player,data"
-        mock_get.return_value = mock_response
-        
-        result = client.get_bulk_team_player_file()
-        
-        expected_url = client.BULK_FILE_BASE_URL + "team_player_data.csv"
-        mock_get.assert_called_once_with(expected_url, follow_redirects=True)
-        assert result == b"team_player,data"
\ No newline at end of file
+        request = router.routes["performances"].calls.last.request
+        assert request.url.params == httpx.QueryParams(expected_params)
+        assert result == [EXPECTED_PERFORMANCE]
+
+    @pytest.mark.parametrize("method_name,filename", [
+        ("get_bulk_player_file", "player_data.csv"),
+        ("get_bulk_league_file", "league_data.csv"),
+        ("get_bulk_performance_file", "performance_data.csv"),
+        ("get_bulk_team_file", "team_data.csv"),
+        ("get_bulk_team_player_file", "team_player_data.csv"),
+    ])
+    def test_get_bulk_file(self, routed_client, router, method_name, filename):
+        """Test getting each bulk file."""
+        result = getattr(routed_client, method_name)()
+        
+        assert router.routes[filename].call_count == 1
+        assert result == _BULK_FILES[filename]
+
+    def test_get_all_bulk_files(self, routed_client, router):
+        """Test downloading every bulk file concurrently."""
+        result = routed_client.get_all_bulk_files()
+
+        for name in routed_client.BULK_FILE_NAMES.values():
+            assert router.routes[name].call_count == 1
+        assert result == {
+            key: _BULK_FILES[name] for key, name in routed_client.BULK_FILE_NAMES.items()
+        }
+
+    def test_get_all_bulk_files_shares_cache(self, routed_client, router):
+        """Test that single and concurrent bulk downloads fill and read one cache."""
+        routed_client.get_bulk_league_file()
+        routed_client.get_all_bulk_files()
+        routed_client.get_bulk_player_file()
+
+        assert router.routes["league_data.csv"].call_count == 1
+        assert router.routes["player_data.csv"].call_count == 1
+
+    def test_get_all_bulk_files_from_threads(self, router):
+        """Test that threads sharing one client can download the bulk files at once."""
+        config = SWCConfig(
+            base_url="https://api.test.com",
+            backoff=False,
+            cache=False
+        )
+        with _routed_client(config, router) as client:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(lambda _: client.get_all_bulk_files(), range(4)))
+
+        expected = {key: _BULK_FILES[name] for key, name in client.BULK_FILE_NAMES.items()}
+        assert results == [expected] * 4
+        assert router.routes["player_data.csv"].call_count == 4
+
+    def test_get_all_bulk_files_raises_on_error(self, routed_client, router):
+        """Test that a failed download is not returned as file content."""
+        router.routes["team_data.csv"].respond(404)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            routed_client.get_all_bulk_files()
+
+    def test_iter_bulk_file_streams_chunks(self, routed_client):
+        """Test streaming a bulk file in chunks."""
+        chunks = list(routed_client.iter_bulk_file('players', chunk_size=4))
+
+        assert chunks == [b"a,b\n", b"1,2\n"]
+
+    def test_download_bulk_file_writes_to_disk(self, routed_client, router, tmp_path):
+        """Test streaming a bulk file straight to disk."""
+        output_file_path = tmp_path / "team_data.csv"
+
+        routed_client.download_bulk_file('teams', output_file_path)
+
+        assert router.routes["team_data.csv"].call_count == 1
+        assert output_file_path.read_bytes() == b"team,data"
+
+    def test_iter_bulk_file_raises_on_error(self, routed_client, router):
+        """Test that a failed download is not yielded as file content."""
+        router.routes["player_data.csv"].respond(404)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            list(routed_client.iter_bulk_file('players'))
+
+    def test_close_closes_http_clients(self, mock_config, mock_transport):
+        """Test that leaving the context manager closes both HTTP clients."""
+        with SWCClient(mock_config, transport=mock_transport) as client:
+            assert not client.http_client.is_closed
+            assert not client.bulk_http_client.is_closed
+
+        assert client.http_client.is_closed
+        assert client.bulk_http_client.is_closed
+
+    def test_subclass_gets_its_own_http_clients(self):
+        """Test that a subclass overriding the HTTP settings does not reuse the base pool."""
+        class SlowSWCClient(SWCClient):
+            __slots__ = ()
+            HTTP_TIMEOUT = httpx.Timeout(120.0)
+
+        config = SWCConfig(
+            base_url="https://shared.test.com",
+            backoff=False
+        )
+        with SWCClient(config) as base, SlowSWCClient(config) as slow:
+            assert slow.http_client is not base.http_client
+            assert slow.bulk_http_client is not base.bulk_http_client
+            assert slow.http_client.timeout == httpx.Timeout(120.0)
+
+    def test_http_clients_shared_until_last_close(self):
+        """Test that clients with the same settings share one HTTP client."""
+        config = SWCConfig(
+            base_url="https://shared.test.com",
+            backoff=False
+        )
+        first = SWCClient(config)
+        second = SWCClient(config)
+
+        assert second.http_client is first.http_client
+        assert second.bulk_http_client is first.bulk_http_client
+
+        with first:
+            first.close()
+        assert not second.http_client.is_closed
+
+        second.close()
+        assert second.http_client.is_closed
+
+        third = SWCClient(config)
+        assert not third.http_client.is_closed
+        assert third.http_client is not second.http_client
+        third.close()
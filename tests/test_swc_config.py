@@ -1,6 +1,5 @@
 import pytest
 import os
-from unittest.mock import patch
 
 from swcpy.swc_config import SWCConfig
 
@@ -8,32 +7,47 @@ from swcpy.swc_config import SWCConfig
 class TestSWCConfig:
     """Test suite for SWCConfig class."""
 
-    def test_init_with_all_parameters(self):
-        """Test configuration initialization with all parameters provided."""
-        config = SWCConfig(
-            base_url="https://api.example.com",
-            backoff=False,
-            backoff_max_time=60,
-            bulk_file_format="parquet"
-        )
-        
-        assert config.swc_base_url == "https://api.example.com"
-        assert config.swc_backoff is False
-        assert config.swc_backoff_max_time == 60
-        assert config.swc_bulk_file_format == "parquet"
+    @pytest.mark.parametrize("kwargs,expected", [
+        (
+            {
+                "base_url": "https://api.example.com",
+                "backoff": False,
+                "backoff_max_time": 60,
+                "bulk_file_format": "parquet"
+            },
+            {
+                "swc_base_url": "https://api.example.com",
+                "swc_backoff": False,
+                "swc_backoff_max_time": 60,
+                "swc_bulk_file_format": "parquet"
+            },
+        ),
+        (
+            {"base_url": "https://api.example.com"},
+            {
+                "swc_base_url": "https://api.example.com",
+                "swc_backoff": True,
+                "swc_backoff_max_time": 30,
+                "swc_bulk_file_format": "csv",
+                "swc_cache": True,
+                "swc_trust_server": False,
+                "swc_raise_for_status": False
+            },
+        ),
+        (
+            {"base_url": "https://api.example.com", "bulk_file_format": "CSV"},
+            {"swc_bulk_file_format": "CSV"},
+        ),
+    ], ids=["all_parameters", "defaults", "bulk_file_format_case_kept"])
+    def test_init(self, kwargs, expected):
+        """Test configuration initialization from explicit parameters and defaults."""
+        config = SWCConfig(**kwargs)
 
-    def test_init_with_defaults(self):
-        """Test configuration initialization with default values."""
-        config = SWCConfig(base_url="https://api.example.com")
-        
-        assert config.swc_base_url == "https://api.example.com"
-        assert config.swc_backoff is True
-        assert config.swc_backoff_max_time == 30
-        assert config.swc_bulk_file_format == "csv"
+        assert {name: getattr(config, name) for name in expected} == expected
 
-    @patch.dict(os.environ, {'SWC_API_BASE_URL': 'https://env.example.com'})
-    def test_init_with_environment_variable(self):
+    def test_init_with_environment_variable(self, monkeypatch):
         """Test configuration initialization using environment variable."""
+        monkeypatch.setenv('SWC_API_BASE_URL', 'https://env.example.com')
         config = SWCConfig()
         
         assert config.swc_base_url == "https://env.example.com"
@@ -41,9 +55,10 @@ class TestSWCConfig:
         assert config.swc_backoff_max_time == 30
         assert config.swc_bulk_file_format == "csv"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_init_without_base_url_raises_error(self):
+    def test_init_without_base_url_raises_error(self, monkeypatch):
         """Test that missing base URL raises ValueError."""
+        for key in [key for key in os.environ if key.startswith('SWC_')]:
+            monkeypatch.delenv(key, raising=False)
         with pytest.raises(ValueError, match="Base URL is required"):
             SWCConfig()
 
@@ -59,23 +74,9 @@ class TestSWCConfig:
         expected = "https://api.example.com True 45 parquet"
         assert str(config) == expected
 
-    @patch.dict(os.environ, {'SWC_API_BASE_URL': 'https://env.example.com'})
-    def test_parameter_overrides_environment(self):
+    def test_parameter_overrides_environment(self, monkeypatch):
         """Test that explicit parameter overrides environment variable."""
+        monkeypatch.setenv('SWC_API_BASE_URL', 'https://env.example.com')
         config = SWCConfig(base_url="https://param.example.com")
         
         assert config.swc_base_url == "https://param.example.com"
-
-    def test_bulk_file_format_case_insensitive(self):
-        """Test that bulk file format handling is case insensitive in usage."""
-        config_upper = SWCConfig(
-            base_url="https://api.example.com",
-            bulk_file_format="CSV"
-        )
-        config_lower = SWCConfig(
-            base_url="https://api.example.com",
-            bulk_file_format="csv"
-        )
-        
-        assert config_upper.swc_bulk_file_format == "CSV"
-        assert config_lower.swc_bulk_file_format == "csv"
\ No newline at end of file